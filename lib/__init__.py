@@ -8,3 +8,5 @@ TESTS_PATH =  LIB_PATH / "tests"
 DATA_PATH = BASE_PATH / "data"
 XEROX_PATH = BASE_PATH / "xerox"
 UNAVAILABLE_NORMS = "n.a."
+ID_COLUMNS = ("subject_id", "norms_id")
+ITEM_COLUMNS_REGEX = r"^i\d+$"
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any, Literal
 import numpy as np
 import pandas as pd
 
-from lib import UNAVAILABLE_NORMS
+from lib import ITEM_COLUMNS_REGEX, UNAVAILABLE_NORMS
 from lib.test_specs import TestSpecs
 from lib.utils import expand_dict_like_columns
 
@@ -65,7 +65,7 @@ class DataContainer:
         Returns:
             pd.DataFrame: A DataFrame containing only the test response data.
         """
-        return self.data.filter(regex=r"^i\d+$", axis=1)
+        return self.data.filter(regex=ITEM_COLUMNS_REGEX, axis=1)
 
     @cached_property # can be cached since it is not modified
     def data_subject_ids(self) -> pd.Series:
@@ -122,18 +122,16 @@ class DataContainer:
         """
         if type == "csv":
 
-            # Create a copy of test results
-            data_to_persist_csv: pd.DataFrame = self.results.copy()
-
-            # Expand dictionary-like columns if requested
+            # Expand dictionary-like columns (the function never mutates its input,
+            # so test results are left untouched without copying them first)
             data_to_persist_csv_expanded: pd.DataFrame =\
-                expand_dict_like_columns(data_to_persist_csv, regex_for_dict_like="std__")
+                expand_dict_like_columns(self.results, regex_for_dict_like="std__")
 
             self.data_provider.persist(data_to_persist_csv_expanded)
 
         else:
-            # Create a copy of test data
-            data_to_persist_json: dict[str, Any] = self.test_specs_and_results.copy()
+            # Get test data (serialized as is, no copy needed)
+            data_to_persist_json: dict[str, Any] = self.test_specs_and_results
 
             # Persist the data to disk
             self.data_provider.persist(data_to_persist_json)
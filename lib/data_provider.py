@@ -1,9 +1,18 @@
+import re
 from typing import TYPE_CHECKING, Any, Literal
 
 import orjson
 import pandas as pd
 
-from lib import BASE_PATH, DATA_PATH, LIB_PATH, TESTS_PATH, XEROX_PATH
+from lib import (
+    BASE_PATH,
+    DATA_PATH,
+    ID_COLUMNS,
+    ITEM_COLUMNS_REGEX,
+    LIB_PATH,
+    TESTS_PATH,
+    XEROX_PATH,
+)
 from lib.errors import NotFoundError, ValidationError
 
 if TYPE_CHECKING:
@@ -131,6 +140,8 @@ class DataProvider:
     def load_test_data(self) -> pd.DataFrame:
         """
         Loads the test's raw data from a CSV file.
+        Only the columns consumed downstream ('subject_id', 'norms_id' and the
+        item columns 'i1', 'i2', ...) are parsed; any other column is skipped.
 
         Returns:
             pd.DataFrame: A DataFrame containing the raw test data.
@@ -141,8 +152,14 @@ class DataProvider:
         # Get the path to the test data file
         data_filepath: Path = self.get_test_path("data")
 
-        # Load a maximum of 1000 rows
-        limited_df: pd.DataFrame = pd.read_csv(data_filepath, nrows=1000)
+        # Load a maximum of 1000 rows, skipping columns the pipeline never uses
+        limited_df: pd.DataFrame = pd.read_csv(
+            data_filepath,
+            nrows=1000,
+            usecols=lambda column: (
+                column in ID_COLUMNS or re.search(ITEM_COLUMNS_REGEX, column) is not None
+            ),
+        )
 
         return limited_df
 
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 
 import pandas as pd
 
-from lib import UNAVAILABLE_NORMS
+from lib import ID_COLUMNS, UNAVAILABLE_NORMS
 from lib.errors import ValidationError
 
 if TYPE_CHECKING:
@@ -96,7 +96,7 @@ class Sanitizer:
 
         # Define the expected column layout based on the test specifications
         # Columns required are: ["subject_id", "norms_id", "i1", "i2", ..., "in"]
-        requested_columns: list[str] = ["subject_id", "norms_id"] + [f"i{i}" for i in range(1, test_length + 1)]
+        requested_columns: list[str] = [*ID_COLUMNS, *(f"i{i}" for i in range(1, test_length + 1))]
 
         # Make sure requested columns are included in the DataFrame columns
         missing_cols: pd.Index = pd.Index(requested_columns).difference(self.data_container.data.columns)
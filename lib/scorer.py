@@ -114,6 +114,16 @@ class Scorer:
             columns=self.test_scales
         )
 
+    @cached_property
+    def answers_isna(self) -> NDArray[np.bool_]:
+        """
+        Boolean mask of missing answers, shared by all missing-related scores.
+
+        Returns:
+            NDArray[np.bool_]: Matrix of missing answers (n_persons, n_items).
+        """
+        return self.answers.isna().values
+
     @cached_property
     def missing_items_by_scale(self) -> pd.DataFrame:
         """
@@ -123,7 +133,7 @@ class Scorer:
             pd.DataFrame: DataFrame with scales as columns and MultiIndex ['straight', 'reversed'] showing missing counts.
         """
         # Vectorized computation using numpy @ operator
-        answers_isna: NDArray[np.bool_] = self.answers.isna().values  # (n_persons, n_items)
+        answers_isna: NDArray[np.bool_] = self.answers_isna  # (n_persons, n_items)
 
         # Matrix multiplication: (n_persons, n_items) @ (n_items, n_scales)
         missing_straight: NDArray[np.int64] = answers_isna @ self.straight_items_by_scale.values  # (n_persons, n_scales)
@@ -145,7 +155,7 @@ class Scorer:
         Returns:
             pd.DataFrame: Total missing items per person per scale.
         """
-        answers_isna: NDArray[np.bool_] = self.answers.isna().values
+        answers_isna: NDArray[np.bool_] = self.answers_isna
         total_items_matrix: NDArray[np.int64] = self.straight_items_by_scale.values + self.reversed_items_by_scale.values
         total_missing: NDArray[np.int64] = answers_isna @ total_items_matrix
 
@@ -3,12 +3,41 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 import pandas as pd
 
+from lib.errors import ValidationError
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
     from lib.test_specs import TestSpecs
 
 
+def normalize_dict_like_column(col_dict: pd.Series) -> pd.DataFrame:
+    """
+    Normalizes a dict-like column into a DataFrame with one column per key.
+
+    Args:
+        col_dict (pd.Series): A Series whose values are dict-like structures.
+
+    Returns:
+        pd.DataFrame: A DataFrame aligned with the Series index. Flat dicts
+                      (e.g., standardized scores) are converted directly,
+                      nested ones are flattened with `pd.json_normalize`.
+    """
+    # Get the values of the column as a list
+    values: list[Any] = col_dict.tolist()
+
+    # Flat dicts need no record path recursion and can be converted directly.
+    if all(
+        isinstance(value, dict) and not any(isinstance(v, dict | list) for v in value.values())
+        for value in values
+    ):
+        return pd.DataFrame(values, index=col_dict.index)
+
+    # Fall back to `pd.json_normalize` for nested structures
+    # (it renumbers rows, so the Series index is restored).
+    return pd.json_normalize(col_dict, meta_prefix="_").set_axis(col_dict.index) # type: ignore[arg-type]
+
+
 def expand_dict_like_columns(df: pd.DataFrame, regex_for_dict_like: str) -> pd.DataFrame:
     """
     Expands dict-like (or JSON-like) columns in a DataFrame into separate columns.
@@ -22,29 +51,29 @@ def expand_dict_like_columns(df: pd.DataFrame, regex_for_dict_like: str) -> pd.D
         pd.DataFrame: A new DataFrame where designated dict-like columns
                       are expanded into individual columns, with their keys as new columns.
                       The names of the expanded columns are prefixed with the original column name.
+                      If no column matches the pattern, the input DataFrame itself
+                      is returned (not a copy). The input is never mutated.
     """
     # Identify dict-like columns in the DataFrame based on the provided regex pattern.
     dict_like_columns: pd.DataFrame = df.filter(regex=regex_for_dict_like)
 
+    # Nothing to expand if no column matches the pattern.
+    if dict_like_columns.shape[1] == 0:
+        return df
+
     # Extract all non-dict-like columns by excluding dict-like ones.
     df_except_dictlike: pd.DataFrame = df.loc[:, ~(df.columns.isin(dict_like_columns.columns))]
 
-    # Initialize the final DataFrame starting with non-dict-like columns.
-    final_df: pd.DataFrame = df_except_dictlike
-
-    # Iterate over the identified dict-like columns to expand their contents.
-    for col_dict_name, col_dict in dict_like_columns.items():
-        # Expand each dict-like column using `pd.json_normalize` and add a prefix for clarity.
-        expanded_column: pd.DataFrame = (
-            pd.json_normalize(col_dict, meta_prefix="_") # type: ignore[arg-type]
-                .add_prefix(f"{col_dict_name}.")
-        )
-
-        # Concatenate the expanded columns into the final DataFrame.
-        final_df = pd.concat([final_df, expanded_column], axis=1)
+    # Expand each dict-like column and add a prefix for clarity.
+    expanded_columns: list[pd.DataFrame] = [
+        normalize_dict_like_column(col_dict).add_prefix(f"{col_dict_name}.")
+        for col_dict_name, col_dict in dict_like_columns.items()
+    ]
 
-    # Return the new DataFrame with expanded columns.
-    return final_df
+    # Concatenate non-dict-like columns and all expanded columns in a single pass
+    # (rows align on the input index, which every expanded column keeps),
+    # and return the new DataFrame with expanded columns.
+    return pd.concat([df_except_dictlike, *expanded_columns], axis=1)
 
 
 def create_normative_table(test_specs: TestSpecs, norms_data: pd.DataFrame) -> pd.DataFrame:
@@ -65,11 +94,20 @@ def create_normative_table(test_specs: TestSpecs, norms_data: pd.DataFrame) -> p
         pd.DataFrame: A DataFrame containing the normative T-scores table with the following columns:
                       - 'norms_id': ID of the normative data entry.
                       - 'scale': Name of the psychological scale.
-                      - 'raw': The raw scores.
-                      - 'std': The standardized T-scores (scaled between 0 and 150).
+                      - 'raw': The raw scores (float for 'mean' norms, int16 otherwise).
+                      - 'std': The standardized T-scores (clipped between 0 and 200, int16).
+                      An empty table with these columns is returned if `norms_data` is empty.
+
+    Raises:
+        ValidationError: If a mean is not finite or a standard deviation is not
+                         a finite positive number.
     """
-    # Initialize an empty DataFrame to store the normative table.
-    norms_table: pd.DataFrame = pd.DataFrame()
+    # Return an empty normative table if no normative data is provided.
+    if norms_data.empty:
+        return pd.DataFrame(columns=["norms_id", "scale", "raw", "std", "std_interpretation"])
+
+    # Initialize the list of per-norms_id T-scores, concatenated once at the end.
+    norms_std: list[NDArray[np.int16]] = []
 
     # Get the maximum Likert-scale value from test specifications.
     likert_max: int = test_specs.get_spec("likert.max")
@@ -77,52 +115,75 @@ def create_normative_table(test_specs: TestSpecs, norms_data: pd.DataFrame) -> p
     # Get type of raw score
     type_of_raw_score: str = test_specs.get_spec("norms.type_of_raw_score")
 
+    # Get the scales defined in the test specifications.
+    # Each scale is a tuple: (scale_name, straight_items, reversed_items)
+    scales: list[tuple[str, list[int], list[int]]] = test_specs.get_spec("scales")
+    scale_names: list[str] = [scale[0] for scale in scales]
+
+    # Generate one grid of raw scores shared by all scales, depending on the specified type.
+    if type_of_raw_score == "mean":
+        # Raw scores are generated with steps of 0.05 if type is 'mean'.
+        raw_scores: NDArray[Any] = np.arange(0, likert_max + 0.05, 0.05).round(2)
+        # Every scale spans the whole grid.
+        max_raw_scores: NDArray[Any] = np.full(len(scales), raw_scores[-1])
+    else:
+        # Raw scores are integers up to the maximum possible score of each scale.
+        max_raw_scores = np.array([
+            (len(items_straight) + len(items_reversed)) * likert_max
+            for _, items_straight, items_reversed in scales
+        ])
+        # The grid spans up to the longest scale, shorter scales are masked below.
+        raw_scores = np.arange(0, max_raw_scores.max() + 1, dtype=np.int16)
+
+    # Mask of the valid raw scores for each scale (n_scales, n_raw_scores).
+    valid: NDArray[np.bool_] = raw_scores[np.newaxis, :] <= max_raw_scores[:, np.newaxis]
+
+    # Scale and raw columns are the same for every norms_id (scales first, then raw scores).
+    scale_column: NDArray[Any] = np.repeat(scale_names, valid.sum(axis=1))
+    raw_column: NDArray[Any] = np.broadcast_to(raw_scores, valid.shape)[valid]
+
+    # Map each (norms_id, scale) pair to its mean and standard deviation ('ds').
+    # In case of duplicated pairs, the first entry is retained.
+    norms_lookup: dict[tuple[str, str], tuple[float, float]] = {}
+    for norms_id, scale_name, scale_mean, scale_ds in (
+        norms_data[["norms_id", "scale", "mean", "ds"]].itertuples(index=False)
+    ):
+        norms_lookup.setdefault((norms_id, scale_name), (scale_mean, scale_ds))
+
+    # Get the unique norms_id (in order of appearance).
+    norms_ids: NDArray[Any] = norms_data["norms_id"].unique()
+
     # Iterate over norms_id
-    for norms_id in norms_data["norms_id"].unique():
-
-        # Iterate over each scale defined in the test specifications.
-        for scale_name, items_straight, items_reversed in test_specs.get_spec("scales"):
-
-            # Filter the norms data for the current scale and norms_id.
-            condition: NDArray[np.bool_] = np.logical_and(
-                norms_data["norms_id"].eq(norms_id),
-                norms_data["scale"].eq(scale_name)
-            )
-
-            # Filter the norms data for the current scale.
-            scale_norms_data: pd.DataFrame = norms_data[condition]
-
-            # Extract the mean and standard deviation ('ds') for the current scale.
-            scale_mean: float = scale_norms_data["mean"].iloc[0]
-            scale_ds: float = scale_norms_data["ds"].iloc[0]
-
-            # Calculate the total number of items in the scale.
-            scale_length: int = len([*items_straight, *items_reversed])
-            # Generate the range of raw scores depending on the specified type.
-            if type_of_raw_score == "mean":
-                # Raw scores are generated with steps of 0.05 if type is 'mean'.
-                scale_raw_scores: pd.Series[Any] = pd.Series(np.arange(0, likert_max + 0.05, 0.05)).round(2)
-            else:
-                # Raw scores are integers up to the maximum possible score.
-                scale_raw_scores = pd.Series(range(0, scale_length * likert_max + 1))
-
-            # Compute the normative table entries for the current scale.
-            scale_norms = pd.DataFrame({
-                "norms_id": norms_id,   # Norms ID.
-                "scale": scale_name,                                # Scale name.
-                "raw": scale_raw_scores,                            # Raw scores.
-                "std": scale_raw_scores
-                        .sub(scale_mean)                               # Subtract the mean.
-                        .div(scale_ds)                                 # Divide by the standard deviation.
-                        .mul(10)                                       # Multiply by 10 to calculate T-scores.
-                        .add(50)                                       # Add 50 to adjust to T-score range.
-                        .clip(0, 200)                                 # Clip values between 0 and 200
-                        .astype(int),                                  # Convert T-scores to integers.
-                "std_interpretation": "◦"                          # Placeholder for interpretation.
-            })
-
-            # Append the current scale's normative data to the overall table.
-            norms_table = pd.concat([norms_table, scale_norms])
-
-    # Reset the index of the final norms table and return it.
-    return norms_table.reset_index(drop=True)
+    for norms_id in norms_ids:
+
+        # Extract the mean and standard deviation ('ds') of every scale as column vectors.
+        scales_mean_ds: NDArray[np.float64] = np.array(
+            [norms_lookup[(norms_id, scale_name)] for scale_name in scale_names], dtype=np.float64
+        )
+        scales_mean: NDArray[np.float64] = scales_mean_ds[:, :1]
+        scales_ds: NDArray[np.float64] = scales_mean_ds[:, 1:]
+
+        # Make sure means and standard deviations can produce valid T-scores.
+        if not (np.isfinite(scales_mean_ds).all() and (scales_ds > 0).all()):
+            raise ValidationError(f"Invalid mean/ds for norms_id {norms_id!r}.")
+
+        # Compute the T-scores of all scales at once by broadcasting (n_scales, n_raw_scores).
+        # Only the first operation allocates, the following ones work in place on the same buffer.
+        t_scores: NDArray[np.float64] = np.subtract(raw_scores, scales_mean)   # Subtract the mean.
+        t_scores /= scales_ds                                                   # Divide by the standard deviation.
+        t_scores *= 10                                                          # Multiply by 10 to calculate T-scores.
+        t_scores += 50                                                          # Add 50 to adjust to T-score range.
+        np.clip(t_scores, 0, 200, out=t_scores)                                 # Clip values between 0 and 200.
+        scales_std: NDArray[np.int16] = t_scores.astype(np.int16)               # Convert T-scores to integers.
+
+        # Keep the T-scores of valid raw scores for the current norms_id.
+        norms_std.append(scales_std[valid])
+
+    # Assemble the normative table once from flat column arrays (norms_id first, then scales).
+    return pd.DataFrame({
+        "norms_id": np.repeat(norms_ids, raw_column.size),      # Norms ID.
+        "scale": np.tile(scale_column, len(norms_ids)),         # Scale name.
+        "raw": np.tile(raw_column, len(norms_ids)),             # Raw scores.
+        "std": np.concatenate(norms_std),                       # T-scores.
+        "std_interpretation": "◦"                               # Placeholder for interpretation.
+    })
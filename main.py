@@ -1,14 +1,16 @@
 import argparse
+import os
 from datetime import date
 
 from lib import TESTS_PATH
-from lib.processor import process
 
 # Get the list of available tests by scanning the tests folder
-available_tests = [
-    f.name for f in TESTS_PATH.iterdir()
-    if f.is_dir() and not f.name.startswith('_')
-]
+# (scandir entries cache their file type, so no extra stat per entry)
+with os.scandir(TESTS_PATH) as entries:
+    available_tests = [
+        entry.name for entry in entries
+        if entry.is_dir() and not entry.name.startswith('_')
+    ]
 
 # Initialize the argument parser
 parser = argparse.ArgumentParser(
@@ -52,5 +54,12 @@ parser.add_argument(
     help="Specify the assesment date. Default is the current date."
 )
 
-# Parse command-line arguments and process
-process(parser.parse_args())
+# Parse command-line arguments
+args = parser.parse_args()
+
+# Import the processing pipeline (pandas, pydantic, weasyprint) only once
+# arguments are valid, so that --help and usage errors return immediately
+from lib.processor import process  # noqa: E402
+
+# Process
+process(args)
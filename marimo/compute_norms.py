@@ -46,21 +46,21 @@ def _(Path):
 
     norms = create_normative_table(test_specs, data_norms)
     norms.tail(6)
-    return TEST_PATH, norms
+    return TEST_PATH, norms, pd
 
 
 @app.cell
-def _(TEST_PATH, norms):
+def _(TEST_PATH, norms, pd):
     # available signs ꜜ ꜛ ◦
-    c1 = norms["std"].between(0, 30, inclusive="left")
-    c2 = norms["std"].between(30, 40, inclusive="left")
-    c3 = norms["std"].between(60, 70, inclusive="left")
-    c4 = norms["std"].between(70, 500, inclusive="left")
-
-    norms.loc[c1, "std_interpretation"] = "ꜜꜜ"
-    norms.loc[c2, "std_interpretation"] = "ꜜ"
-    norms.loc[c3, "std_interpretation"] = "ꜛ"
-    norms.loc[c4, "std_interpretation"] = "ꜛꜛ"
+    # bucket std in a single pass: [0,30) ꜜꜜ, [30,40) ꜜ, [40,60) ◦, [60,70) ꜛ, [70,+inf) ꜛꜛ
+    # (stored as an ordered categorical, i.e. one small int code per row)
+    norms["std_interpretation"] = pd.cut(
+        norms["std"],
+        bins=[float("-inf"), 30, 40, 60, 70, float("inf")],
+        labels=["ꜜꜜ", "ꜜ", "◦", "ꜛ", "ꜛꜛ"],
+        right=False,
+        ordered=True,
+    )
 
 
     norms.to_csv(TEST_PATH / f"{TEST_PATH.name}_norms.csv", index=False)